@@ -146,11 +146,13 @@ Mesh
     mesh_contours_numpy
     mesh_degree_matrix
     mesh_face_matrix
+    mesh_flatness_numpy
     mesh_geodesic_distances_numpy
     mesh_isolines_numpy
     mesh_laplacian_matrix
     mesh_oriented_bounding_box_numpy
     mesh_oriented_bounding_box_xy_numpy
+    mesh_planarize_faces_numpy
     mesh_transform_numpy
     mesh_transformed_numpy
     trimesh_cotangent_laplacian_matrix
@@ -312,11 +314,13 @@ if not compas.IPY:
         mesh_contours_numpy,
         mesh_degree_matrix,
         mesh_face_matrix,
+        mesh_flatness_numpy,
         mesh_geodesic_distances_numpy,
         mesh_isolines_numpy,
         mesh_laplacian_matrix,
         mesh_oriented_bounding_box_numpy,
         mesh_oriented_bounding_box_xy_numpy,
+        mesh_planarize_faces_numpy,
         mesh_transform_numpy,
         mesh_transformed_numpy,
         trimesh_cotangent_laplacian_matrix,
@@ -454,11 +458,13 @@ if not compas.IPY:
         'mesh_contours_numpy',
         'mesh_degree_matrix',
         'mesh_face_matrix',
+        'mesh_flatness_numpy',
         'mesh_geodesic_distances_numpy',
         'mesh_isolines_numpy',
         'mesh_laplacian_matrix',
         'mesh_oriented_bounding_box_numpy',
         'mesh_oriented_bounding_box_xy_numpy',
+        'mesh_planarize_faces_numpy',
         'mesh_transform_numpy',
         'mesh_transformed_numpy',
         'trimesh_cotangent_laplacian_matrix',
@@ -51,6 +51,8 @@ class HalfEdge(Datastructure):
         super(HalfEdge, self).__init__()
         self._max_vertex = -1
         self._max_face = -1
+        self._topology_version = 0
+        self._topology_cache = {}
         self.vertex = {}
         self.halfedge = {}
         self.face = {}
@@ -192,6 +194,8 @@ class HalfEdge(Datastructure):
         self.facedata = {}
         self._max_vertex = -1
         self._max_face = -1
+        self._topology_version += 1
+        self._topology_cache = {}
 
     def get_any_vertex(self):
         """Get the identifier of a random vertex.
@@ -374,6 +378,7 @@ class HalfEdge(Datastructure):
         if key not in self.vertex:
             self.vertex[key] = {}
             self.halfedge[key] = {}
+            self._topology_version += 1
         attr = attr_dict or {}
         attr.update(kwattr)
         self.vertex[key].update(attr)
@@ -429,6 +434,7 @@ class HalfEdge(Datastructure):
             self.halfedge[u][v] = fkey
             if u not in self.halfedge[v]:
                 self.halfedge[v][u] = None
+        self._topology_version += 1
         return fkey
 
     # --------------------------------------------------------------------------
@@ -479,6 +485,7 @@ class HalfEdge(Datastructure):
                         del self.edgedata[edge]
         del self.halfedge[key]
         del self.vertex[key]
+        self._topology_version += 1
 
     def delete_face(self, fkey):
         """Delete a face from the mesh object.
@@ -510,6 +517,7 @@ class HalfEdge(Datastructure):
         del self.face[fkey]
         if fkey in self.facedata:
             del self.facedata[fkey]
+        self._topology_version += 1
 
     def remove_unused_vertices(self):
         """Remove all unused vertices from the mesh object.
@@ -526,6 +534,7 @@ class HalfEdge(Datastructure):
                 if not self.halfedge[u]:
                     del self.vertex[u]
                     del self.halfedge[u]
+        self._topology_version += 1
 
     cull_vertices = remove_unused_vertices
 
@@ -3,6 +3,8 @@ from __future__ import division
 from __future__ import print_function
 
 
+from numpy import empty
+
 from compas.geometry import oriented_bounding_box_numpy
 from compas.geometry import oriented_bounding_box_xy_numpy
 
@@ -13,6 +15,19 @@ __all__ = [
 ]
 
 
+def _mesh_vertices_numpy(mesh):
+    """Construct an array of vertex coordinates directly from the vertex attributes,
+    without building an intermediate list of lists.
+
+    """
+    xyz = empty((mesh.number_of_vertices(), 3), dtype=float)
+    for index, (_, attr) in enumerate(mesh.vertices(True)):
+        xyz[index, 0] = attr['x']
+        xyz[index, 1] = attr['y']
+        xyz[index, 2] = attr['z']
+    return xyz
+
+
 def mesh_oriented_bounding_box_numpy(mesh):
     """Compute the (axis aligned) bounding box of a mesh.
 
@@ -35,7 +50,7 @@ def mesh_oriented_bounding_box_numpy(mesh):
     8
 
     """
-    xyz = mesh.vertices_attributes('xyz')
+    xyz = _mesh_vertices_numpy(mesh)
     return oriented_bounding_box_numpy(xyz)
 
 
@@ -60,5 +75,5 @@ def mesh_oriented_bounding_box_xy_numpy(mesh):
     [[10.0, 0.0], [0.0, 0.0], [0.0, 10.0], [10.0, 10.0]]
 
     """
-    xyz = mesh.vertices_attributes('xyz')
+    xyz = _mesh_vertices_numpy(mesh)
     return oriented_bounding_box_xy_numpy(xyz)
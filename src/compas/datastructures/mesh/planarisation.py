@@ -3,7 +3,6 @@ from __future__ import absolute_import
 from __future__ import division
 
 from compas.geometry import project_points_plane
-from compas.geometry import centroid_points
 from compas.geometry import distance_point_point
 from compas.geometry import distance_line_line
 from compas.geometry import bestfit_plane
@@ -72,8 +71,6 @@ def mesh_planarize_faces(mesh, fixed=None, kmax=100, callback=None, callback_arg
         A list of fixed vertices.
     kmax : int, optional
         The number of iterations.
-    d : float, optional
-        A damping factor.
     callback : callable, optional
         A user-defined callback that is called after every iteration.
     callback_args : list[Any], optional
@@ -91,27 +88,42 @@ def mesh_planarize_faces(mesh, fixed=None, kmax=100, callback=None, callback_arg
     fixed = fixed or []
     fixed = set(fixed)
 
+    # the topology does not change between iterations
+    vertices = list(mesh.vertices())
+    faces = {fkey: mesh.face_vertices(fkey) for fkey in mesh.faces()}
+
     for k in range(kmax):
 
-        positions = {key: [] for key in mesh.vertices()}
+        coordinates = {key: mesh.vertex_coordinates(key) for key in vertices}
+        positions = {key: [0.0, 0.0, 0.0] for key in vertices}
+        counts = {key: 0 for key in vertices}
 
-        for fkey in mesh.faces():
-            vertices = mesh.face_vertices(fkey)
-            points = [mesh.vertex_coordinates(key) for key in vertices]
+        for fkey in faces:
+            face = faces[fkey]
+            points = [coordinates[key] for key in face]
             plane = bestfit_plane(points)
             projections = project_points_plane(points, plane)
 
-            for index, key in enumerate(vertices):
-                positions[key].append(projections[index])
+            for index, key in enumerate(face):
+                x, y, z = projections[index]
+                position = positions[key]
+                position[0] += x
+                position[1] += y
+                position[2] += z
+                counts[key] += 1
 
         for key, attr in mesh.vertices(True):
             if key in fixed:
                 continue
 
-            x, y, z = centroid_points(positions[key])
-            attr['x'] = x
-            attr['y'] = y
-            attr['z'] = z
+            count = counts[key]
+            if not count:
+                continue
+
+            position = positions[key]
+            attr['x'] = position[0] / count
+            attr['y'] = position[1] / count
+            attr['z'] = position[2] / count
 
         if callback:
             callback(k, callback_args)
@@ -0,0 +1,253 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import abs as npabs
+from numpy import add
+from numpy import asarray
+from numpy import cross
+from numpy import einsum
+from numpy import roll
+from numpy import where
+from numpy import zeros
+from numpy.linalg import eigh
+from numpy.linalg import norm
+
+
+__all__ = [
+    'mesh_flatness_numpy',
+    'mesh_planarize_faces_numpy',
+]
+
+
+# if no point of a face moved more than this amount since the previous iteration,
+# the best-fit plane of the face is reused instead of recomputed.
+PLANE_CACHE_TOL = 1e-9
+
+
+def _topology_arrays(mesh):
+    """Return the vertex keys, the vertex index map, the face keys,
+    and the face index arrays of the mesh.
+
+    The face index arrays are grouped by face degree: per degree, the result holds
+    an array with the positions of the faces in the face sequence,
+    and an (F, K) array of face vertex indices.
+
+    The arrays are cached on the mesh and reused until its topology changes.
+
+    """
+    version = mesh._topology_version, mesh.number_of_vertices(), mesh.number_of_faces()
+    cache = mesh._topology_cache
+    if version not in cache:
+        vkeys = list(mesh.vertices())
+        vindex = {key: index for index, key in enumerate(vkeys)}
+        fkeys = list(mesh.faces())
+        groups = {}
+        for position, fkey in enumerate(fkeys):
+            vertices = mesh.face_vertices(fkey)
+            positions, faces = groups.setdefault(len(vertices), ([], []))
+            positions.append(position)
+            faces.append([vindex[key] for key in vertices])
+        buckets = [(asarray(positions), asarray(faces)) for positions, faces in groups.values()]
+        cache.clear()
+        cache[version] = vkeys, vindex, fkeys, buckets
+    return cache[version]
+
+
+def mesh_flatness_numpy(mesh, maxdev=1.0):
+    """Compute mesh flatness per face.
+
+    This is a vectorized equivalent of :func:`mesh_flatness`.
+    All faces of the same degree are processed together with NumPy array operations,
+    which is significantly faster than the pure-Python version for large meshes.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    maxdev : float, optional
+        A maximum value for the allowed deviation from flatness.
+
+    Returns
+    -------
+    list[float]
+        For each face, a deviation from *flatness*.
+
+    Notes
+    -----
+    The "flatness" of a face is expressed as the ratio of the distance between
+    the diagonals to the average edge length. For the fabrication of glass panels,
+    for example, 0.02 could be a reasonable maximum value.
+
+    Warnings
+    --------
+    This function only works as expected for quadrilateral faces.
+
+    """
+    _, _, fkeys, buckets = _topology_arrays(mesh)
+
+    dev = [0.0] * len(fkeys)
+    xyz = asarray(mesh.vertices_attributes('xyz'))
+
+    for positions, faces in buckets:
+        if faces.shape[1] == 3:
+            continue
+        P = xyz[faces]
+        lengths = norm(roll(P, -1, axis=1) - P, axis=2).mean(axis=1)
+        a = P[:, 0]
+        b = P[:, 1]
+        c = P[:, 2]
+        d = P[:, 3]
+        ac = c - a
+        bd = d - b
+        ab = b - a
+        n = cross(ac, bd)
+        ln = norm(n, axis=1)
+        # for non-degenerate faces, the distance between the diagonals
+        # is the length of the projection of ``ab`` onto the common normal of the diagonals.
+        # if the diagonals are parallel, use the distance from ``a`` to the diagonal ``bd`` instead.
+        skew = npabs(einsum('ij,ij->i', n, ab)) / where(ln > 0, ln, 1.0)
+        parallel = norm(cross(bd, ab), axis=1) / norm(bd, axis=1)
+        distances = where(ln > 0, skew, parallel)
+        deviations = (distances / lengths) / maxdev
+        for position, deviation in zip(positions, deviations):
+            dev[position] = deviation
+    return dev
+
+
+def mesh_planarize_faces_numpy(mesh, fixed=None, kmax=100, damping=1.0, tol=1e-6, callback=None, callback_args=None):
+    """Planarise a set of connected faces.
+
+    Planarisation is implemented as a two-step iterative procedure. At every
+    iteration, faces are first individually projected to their best-fit plane,
+    and then the vertices are projected to the centroid of the disconnected
+    corners of the faces.
+
+    This is a NumPy-based equivalent of :func:`mesh_planarize_faces`.
+    The face-vertex topology is packed once into index arrays grouped by face degree,
+    and every iteration runs a purely numeric kernel over those arrays,
+    which is significantly faster than the pure-Python version for large meshes.
+
+    Parameters
+    ----------
+    mesh : :class:`~compas.datastructures.Mesh`
+        A mesh object.
+    fixed : list[int], optional
+        A list of fixed vertices.
+    kmax : int, optional
+        The maximum number of iterations.
+    damping : float, optional
+        A damping factor for the vertex updates.
+        At ``1.0``, every vertex moves to the centroid of its face projections;
+        smaller values move it only part of the way there.
+    tol : float, optional
+        The iterations stop when no vertex moved more than this distance
+        during the last iteration.
+    callback : callable, optional
+        A user-defined callback that is called after every iteration.
+    callback_args : list[Any], optional
+        A list of arguments to be passed to the callback function.
+
+    Returns
+    -------
+    None
+        The mesh is modified in place.
+
+    Notes
+    -----
+    The iterations run entirely on a coordinate array. The vertex attributes of
+    the mesh are only updated before every callback invocation, and once after
+    the last iteration.
+
+    The per-iteration work is dominated by the batched eigendecomposition of the
+    face covariance matrices, which is dispatched to LAPACK in a single call per
+    face-degree group. Multi-core machines benefit automatically through the
+    threading of the linked BLAS/LAPACK backend; no explicit parallelisation
+    is done at the Python level.
+
+    """
+    if callback:
+        if not callable(callback):
+            raise Exception('The callback is not callable.')
+
+    fixed = fixed or []
+    fixed = set(fixed)
+
+    vkeys, _, _, buckets = _topology_arrays(mesh)
+    buckets = [faces for _, faces in buckets]
+
+    free = asarray([key not in fixed for key in vkeys])
+    xyz = asarray([mesh.vertex_coordinates(key) for key in vkeys])
+
+    caches = [None] * len(buckets)
+
+    for k in range(kmax):
+
+        positions, counts = _planarize_faces_iter(xyz, buckets, caches)
+
+        mask = free & (counts > 0)
+        updated = positions[mask] / counts[mask].reshape((-1, 1))
+        if damping != 1.0:
+            updated = xyz[mask] + damping * (updated - xyz[mask])
+
+        displacement = norm(updated - xyz[mask], axis=1).max() if len(updated) else 0.0
+        xyz[mask] = updated
+
+        if callback:
+            _store_vertices(mesh, fixed, xyz)
+            callback(k, callback_args)
+
+        if displacement < tol:
+            break
+
+    _store_vertices(mesh, fixed, xyz)
+
+
+def _store_vertices(mesh, fixed, xyz):
+    """Write the coordinates of the free vertices back to the vertex attributes."""
+    for index, (key, attr) in enumerate(mesh.vertices(True)):
+        if key in fixed:
+            continue
+        attr['x'] = xyz[index, 0]
+        attr['y'] = xyz[index, 1]
+        attr['z'] = xyz[index, 2]
+
+
+def _planarize_faces_iter(xyz, buckets, caches):
+    """Project the face points onto the best-fit planes of their faces.
+
+    The faces are grouped by degree in ``buckets``, so that the plane fitting
+    and the projection can be batched per group: a single call to ``eigh``
+    on the stacked 3x3 covariance matrices computes all plane normals of a group.
+
+    ``caches`` holds, per bucket, the face points and plane normals of the
+    previous iteration. Faces whose points did not move since then keep their
+    plane and are excluded from the eigendecomposition, which skips most of the
+    fitting work once the mesh starts to converge.
+
+    Returns the per-vertex sums of the face point projections, and the number
+    of projections contributing to each vertex.
+
+    """
+    positions = zeros(xyz.shape)
+    counts = zeros(len(xyz), dtype=int)
+    for index, faces in enumerate(buckets):
+        points = xyz[faces]
+        centered = points - points.mean(axis=1).reshape((-1, 1, 3))
+        if caches[index] is None:
+            cov = einsum('fki,fkj->fij', centered, centered)
+            _, vectors = eigh(cov)
+            normals = vectors[:, :, 0]
+        else:
+            previous, normals = caches[index]
+            moved = npabs(points - previous).max(axis=(1, 2)) > PLANE_CACHE_TOL
+            if moved.any():
+                cov = einsum('fki,fkj->fij', centered[moved], centered[moved])
+                _, vectors = eigh(cov)
+                normals[moved] = vectors[:, :, 0]
+        caches[index] = points, normals
+        distances = einsum('fki,fi->fk', centered, normals)
+        projections = points - distances[:, :, None] * normals[:, None, :]
+        add.at(positions, faces.ravel(), projections.reshape((-1, 3)))
+        add.at(counts, faces.ravel(), 1)
+    return positions, counts
@@ -133,6 +133,7 @@ class PluginManager(object):
     def __init__(self):
         self.importer = Importer()
         self._registry = {}
+        self._registry_version = 0
         self._discovery_done = False
         self._discovery_lock = threading.Lock()
 
@@ -232,6 +233,10 @@ class PluginManager(object):
                     print('Registered plugin with ID "{}" for extension point: {}'.format(plugin_impl.id, plugin_opts['extension_point_url']))
                 count += 1
 
+        if count:
+            # invalidate the plugin selections cached by the pluggable wrappers
+            self._registry_version += 1
+
         return count
 
     def _parse_plugin_opts(self, plugin_method):
@@ -280,13 +285,21 @@ def pluggable(pluggable_method=None, category=None, selector='first_match', doma
     ...    pass
     """
     def pluggable_decorator(func):
+        extension_point_url = _get_extension_point_url_from_method(domain, category, func)
+        cache = {}
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            extension_point_url = _get_extension_point_url_from_method(domain, category, func)
-
             # Select first matching plugin
             if selector == 'first_match':
-                plugin_impl = _select_plugin(extension_point_url)
+                # reuse the previously selected plugin
+                # as long as no new plugins have been registered since
+                plugin_impl = cache.get('plugin')
+
+                if plugin_impl is None or cache['version'] != plugin_manager._registry_version:
+                    plugin_impl = _select_plugin(extension_point_url)
+                    cache['plugin'] = plugin_impl
+                    cache['version'] = plugin_manager._registry_version
 
                 # Invoke plugin
                 return plugin_impl.method(*args, **kwargs)
@@ -3,11 +3,9 @@ from __future__ import absolute_import
 from __future__ import division
 
 import Rhino
-import compas_rhino
+import compas
 
-from compas.utilities import memoize, geometric_key
 from compas.datastructures import Mesh
-from compas.datastructures import meshes_join
 
 from ._primitives import point_to_compas
 
@@ -15,6 +13,27 @@ from ._geometry import RhinoGeometry
 from ._exceptions import ConversionError
 
 
+def _precision_factor(precision=None):
+    """Scale factor corresponding to a precision specifier, or None for decimal integer precision."""
+    precision = precision or compas.PRECISION
+    if precision == 'd':
+        return None
+    return 10 ** int(precision[:-1])
+
+
+def _point_key(xyz, factor):
+    """Convert XYZ coordinates to an integer tuple that can be used as a dict key.
+
+    This identifies coincident points at the same precision as ``geometric_key``,
+    but hashing an integer tuple is much cheaper than formatting and hashing a string.
+
+    """
+    x, y, z = xyz
+    if factor is None:
+        return int(x), int(y), int(z)
+    return int(round(x * factor)), int(round(y * factor)), int(round(z * factor))
+
+
 class RhinoSurface(RhinoGeometry):
     """Wrapper for Rhino surfaces."""
 
@@ -116,29 +135,24 @@ class RhinoSurface(RhinoGeometry):
         else:
             brepfaces = brep.Faces
         # vertex maps and face lists
-        gkey_xyz = {}
+        factor = _precision_factor()
+        key_index = {}
+        vertices = []
         faces = []
         for face in brepfaces:
             loop = face.OuterLoop
             curve = loop.To3dCurve()
             segments = curve.Explode()
-            a = segments[0].PointAtStart
-            b = segments[0].PointAtEnd
-            a_gkey = geometric_key(a)
-            b_gkey = geometric_key(b)
-            gkey_xyz[a_gkey] = a
-            gkey_xyz[b_gkey] = b
-            face = [a_gkey, b_gkey]
-            for segment in segments[1:-1]:
-                b = segment.PointAtEnd
-                b_gkey = geometric_key(b)
-                face.append(b_gkey)
-                gkey_xyz[b_gkey] = b
+            points = [segments[0].PointAtStart, segments[0].PointAtEnd]
+            points += [segment.PointAtEnd for segment in segments[1:-1]]
+            face = []
+            for point in points:
+                key = _point_key(point, factor)
+                if key not in key_index:
+                    key_index[key] = len(vertices)
+                    vertices.append(list(point))
+                face.append(key_index[key])
             faces.append(face)
-        # vertices and faces
-        gkey_index = {gkey: index for index, gkey in enumerate(gkey_xyz)}
-        vertices = [list(xyz) for gkey, xyz in gkey_xyz.items()]
-        faces = [[gkey_index[gkey] for gkey in face] for face in faces]
         # remove duplicates from vertexlist
         polygons = []
         for temp in faces:
@@ -199,29 +213,45 @@ class RhinoSurface(RhinoGeometry):
         else:
             faces = brep.Faces
 
-        meshes = []
+        vertices = []
+        quads = []
         for face in faces:
             domain_u = face.Domain(0)
             domain_v = face.Domain(1)
             du = (domain_u[1] - domain_u[0]) / (nu)
             dv = (domain_v[1] - domain_v[0]) / (nv)
 
-            @memoize
-            def point_at(i, j):
-                return point_to_compas(face.PointAt(i, j))
+            # evaluate every UV grid point exactly once
+            offset = len(vertices)
+            for i in range(nu + 1):
+                u = domain_u[0] + i * du
+                for j in range(nv + 1):
+                    v = domain_v[0] + j * dv
+                    vertices.append(point_to_compas(face.PointAt(u, v)))
 
-            quads = []
             for i in range(nu):
                 for j in range(nv):
-                    a = point_at(domain_u[0] + (i + 0) * du, domain_v[0] + (j + 0) * dv)
-                    b = point_at(domain_u[0] + (i + 1) * du, domain_v[0] + (j + 0) * dv)
-                    c = point_at(domain_u[0] + (i + 1) * du, domain_v[0] + (j + 1) * dv)
-                    d = point_at(domain_u[0] + (i + 0) * du, domain_v[0] + (j + 1) * dv)
+                    a = offset + (i + 0) * (nv + 1) + (j + 0)
+                    b = offset + (i + 1) * (nv + 1) + (j + 0)
+                    c = offset + (i + 1) * (nv + 1) + (j + 1)
+                    d = offset + (i + 0) * (nv + 1) + (j + 1)
                     quads.append([a, b, c, d])
 
-            meshes.append(cls.from_polygons(quads))
-
-        return meshes_join(meshes, cls=cls)
+        if weld:
+            factor = _precision_factor()
+            key_index = {}
+            welded = []
+            index_map = []
+            for point in vertices:
+                key = _point_key(point, factor)
+                if key not in key_index:
+                    key_index[key] = len(welded)
+                    welded.append(point)
+                index_map.append(key_index[key])
+            vertices = welded
+            quads = [[index_map[index] for index in quad] for quad in quads]
+
+        return cls.from_vertices_and_faces(vertices, quads)
 
     def closest_point(self, xyz):
         """Return the XYZ coordinates of the closest point on the surface from input XYZ-coordinates.
@@ -237,9 +267,29 @@ class RhinoSurface(RhinoGeometry):
             The XYZ coordinates of the closest point on the surface.
 
         """
-        return compas_rhino.rs.EvaluateSurface(self.guid, * compas_rhino.rs.SurfaceClosestPoint(self.guid, xyz))
+        point = Rhino.Geometry.Point3d(*xyz)
+        geometry = self.geometry
+        if isinstance(geometry, Rhino.Geometry.Brep):
+            return list(geometry.ClosestPoint(point))
+        result, u, v = geometry.ClosestPoint(point)
+        if not result:
+            return None
+        return list(geometry.PointAt(u, v))
 
     def closest_points(self, points):
+        """Return the XYZ coordinates of the closest points on the surface from a list of input points.
+
+        Parameters
+        ----------
+        points : list
+            A list of XYZ coordinates.
+
+        Returns
+        -------
+        list
+            The XYZ coordinates of the closest point on the surface for each of the input points.
+
+        """
         return [self.closest_point(point) for point in points]
 
     # def closest_point_on_boundaries(self, xyz):
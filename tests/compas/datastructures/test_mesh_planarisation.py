@@ -0,0 +1,56 @@
+import compas
+
+from compas.datastructures import Mesh
+from compas.datastructures import mesh_flatness
+from compas.datastructures import mesh_flatness_numpy
+from compas.datastructures import mesh_planarize_faces_numpy
+from compas.geometry import allclose
+
+
+def test_mesh_flatness_numpy():
+    mesh = Mesh.from_obj(compas.get('hypar.obj'))
+    assert allclose(mesh_flatness_numpy(mesh, maxdev=0.02), mesh_flatness(mesh, maxdev=0.02))
+
+
+def test_mesh_planarize_faces_numpy():
+    mesh = Mesh.from_obj(compas.get('hypar.obj'))
+    fixed = list(mesh.vertices_where({'vertex_degree': 2}))
+    dev = mesh_flatness(mesh)
+    before = sum(dev) / len(dev)
+    mesh_planarize_faces_numpy(mesh, fixed=fixed, kmax=100)
+    dev = mesh_flatness(mesh)
+    after = sum(dev) / len(dev)
+    assert after < before
+
+
+def test_mesh_planarize_faces_numpy_fixed():
+    mesh = Mesh.from_obj(compas.get('hypar.obj'))
+    fixed = list(mesh.vertices_where({'vertex_degree': 2}))
+    before = {key: mesh.vertex_coordinates(key) for key in fixed}
+    mesh_planarize_faces_numpy(mesh, fixed=fixed, kmax=10)
+    for key in fixed:
+        assert allclose(before[key], mesh.vertex_coordinates(key))
+
+
+def test_mesh_planarize_faces_numpy_tol():
+    mesh = Mesh.from_obj(compas.get('hypar.obj'))
+    iterations = []
+    mesh_planarize_faces_numpy(mesh, kmax=1000, tol=0.1, callback=lambda k, args: iterations.append(k))
+    assert len(iterations) < 1000
+
+
+def test_mesh_flatness_numpy_triangles():
+    mesh = Mesh.from_obj(compas.get('hypar.obj'))
+    mesh.quads_to_triangles()
+    assert all(dev == 0.0 for dev in mesh_flatness_numpy(mesh))
+
+
+def test_topology_arrays_cached():
+    from compas.datastructures.mesh.planarisation_numpy import _topology_arrays
+
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    arrays = _topology_arrays(mesh)
+    assert _topology_arrays(mesh) is arrays
+
+    mesh.delete_face(mesh.face_sample(size=1)[0])
+    assert _topology_arrays(mesh) is not arrays
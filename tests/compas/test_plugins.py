@@ -36,3 +36,31 @@ def test_ensure_implementations_fails_with_incomplete_impl():
 
 def test_ensure_implementations_with_valid_impl():
     PluginValidator.ensure_implementations(CompleteImpl)
+
+
+def test_pluggable_caches_selected_plugin():
+    from types import ModuleType
+
+    from compas.plugins import plugin
+    from compas.plugins import pluggable
+    from compas.plugins import plugin_manager
+
+    @pluggable(category='tests')
+    def cached_hook():
+        raise NotImplementedError
+
+    @plugin(category='tests', pluggable_name='cached_hook')
+    def cached_hook_impl():
+        return 'result'
+
+    module = ModuleType('compas_test_cached_plugin')
+    module.cached_hook_impl = cached_hook_impl
+    plugin_manager.register_module(module)
+
+    assert cached_hook() == 'result'
+
+    # the selection is reused without a registry lookup
+    from compas.plugins import _get_extension_point_url_from_name
+    url = _get_extension_point_url_from_name('https://plugins.compas.dev/', 'tests', 'cached_hook')
+    plugin_manager._registry.pop(url)
+    assert cached_hook() == 'result'